@@ -19,7 +19,6 @@ from uuid import UUID
 from zenml.analytics.enums import AnalyticsEvent
 from zenml.analytics.utils import track_handler
 from zenml.client import Client
-from zenml.integrations.huggingface import HUGGINGFACE_SERVICE_ARTIFACT
 from zenml.integrations.huggingface.flavors.huggingface_model_deployer_flavor import (
     HuggingFaceModelDeployerConfig,
     HuggingFaceModelDeployerFlavor,
@@ -105,11 +104,6 @@ class HuggingFaceModelDeployer(BaseModelDeployer):
         """
         # create a new service for the new model
         service = HuggingFaceDeploymentService(uuid=id, config=config)
-
-        logger.info(
-            f"Creating an artifact {HUGGINGFACE_SERVICE_ARTIFACT} with service instance attached as metadata."
-            " If there's an active pipeline and/or model this artifact will be associated with it."
-        )
         service.start(timeout=timeout)
         return service
 
@@ -159,17 +153,19 @@ class HuggingFaceModelDeployer(BaseModelDeployer):
                 id=id, timeout=timeout, config=config
             )
             logger.info(
-                f"Creating a new Hugging Face inference endpoint service: {service}"
+                "Creating a new Hugging Face inference endpoint service: %s",
+                service,
             )
             # Add telemetry with metadata that gets the stack metadata and
             # differentiates between pure model and custom code deployments
-            stack = Client().active_stack
+            client = Client()
+            stack = client.active_stack
             stack_metadata = {
                 component_type.value: component.flavor
                 for component_type, component in stack.components.items()
             }
             analytics_handler.metadata = {
-                "store_type": Client().zen_store.type.value,
+                "store_type": client.zen_store.type.value,
                 **stack_metadata,
             }
 
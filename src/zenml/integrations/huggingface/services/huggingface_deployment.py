@@ -13,7 +13,8 @@
 #  permissions and limitations under the License.
 """Implementation of the Hugging Face Deployment service."""
 
-from typing import Any, Generator, Optional, Tuple
+import time
+from typing import Any, Callable, Generator, Optional, Tuple, TypeVar
 
 from huggingface_hub import (
     InferenceClient,
@@ -24,7 +25,7 @@ from huggingface_hub import (
     get_inference_endpoint,
 )
 from huggingface_hub.utils import HfHubHTTPError
-from pydantic import Field
+from pydantic import Field, PositiveInt
 
 from zenml.client import Client
 from zenml.integrations.huggingface.flavors.huggingface_model_deployer_flavor import (
@@ -39,9 +40,37 @@ logger = get_logger(__name__)
 POLLING_TIMEOUT = 1200
 UUID_SLICE_LENGTH: int = 8
 
+T = TypeVar("T")
+
+
+def _get_status_code(error: HfHubHTTPError) -> Optional[int]:
+    """Get the HTTP status code of a failed Hugging Face API request.
+
+    Args:
+        error: The error raised for the request.
+
+    Returns:
+        The status code, or None if no response was received.
+    """
+    return error.response.status_code if error.response is not None else None
+
 
 class HuggingFaceServiceConfig(HuggingFaceBaseConfig, ServiceConfig):
-    """Hugging Face service configurations."""
+    """Hugging Face service configurations.
+
+    Attributes:
+        use_cache: whether the inference endpoint is allowed to serve cached
+            responses for repeated inputs.
+        retry_attempts: maximum number of attempts for Hugging Face API calls
+            that fail with a transient HTTP error.
+        retry_max_backoff: maximum time in seconds to wait between two
+            attempts. The wait time starts at one second and doubles after
+            every failed attempt.
+    """
+
+    use_cache: bool = True
+    retry_attempts: PositiveInt = 5
+    retry_max_backoff: PositiveInt = 30
 
 
 class HuggingFaceServiceStatus(ServiceStatus):
@@ -68,6 +97,9 @@ class HuggingFaceDeploymentService(BaseDeploymentService):
         default_factory=lambda: HuggingFaceServiceStatus()
     )
 
+    _token: Optional[str] = None
+    _inference_client: Optional[InferenceClient] = None
+
     def __init__(self, config: HuggingFaceServiceConfig, **attrs: Any):
         """Initialize the Hugging Face deployment service.
 
@@ -80,12 +112,18 @@ class HuggingFaceDeploymentService(BaseDeploymentService):
     def get_token(self) -> str:
         """Get the Hugging Face token.
 
+        The token is resolved once per service instance and reused for all
+        subsequent endpoint operations.
+
         Raises:
             ValueError: If token not found.
 
         Returns:
             Hugging Face token.
         """
+        if self._token is not None:
+            return self._token
+
         client = Client()
         token = None
         if self.config.secret_name:
@@ -104,6 +142,7 @@ class HuggingFaceDeploymentService(BaseDeploymentService):
             token = model_deployer.config.token or None
         if not token:
             raise ValueError("Token not found.")
+        self._token = token
         return token
 
     @property
@@ -133,10 +172,46 @@ class HuggingFaceDeploymentService(BaseDeploymentService):
     def inference_client(self) -> InferenceClient:
         """Get the Hugging Face InferenceClient from Inference Endpoint.
 
+        The client is created once and reused for all subsequent requests.
+
         Returns:
             Hugging Face inference client.
         """
-        return self.hf_endpoint.client
+        return self._get_inference_client()
+
+    def _get_inference_client(
+        self, hf_endpoint: Optional[InferenceEndpoint] = None
+    ) -> InferenceClient:
+        """Get or create the cached Hugging Face InferenceClient.
+
+        Args:
+            hf_endpoint: The already fetched inference endpoint. If not
+                given, the endpoint is fetched when no client is cached yet.
+
+        Returns:
+            Hugging Face inference client.
+
+        Raises:
+            InferenceEndpointError: If the inference endpoint is not yet
+                deployed.
+        """
+        if self._inference_client is not None:
+            return self._inference_client
+
+        endpoint_url = (hf_endpoint or self.hf_endpoint).url
+        if endpoint_url is None:
+            # Without a URL the client would silently fall back to the
+            # public serverless model for the task
+            raise InferenceEndpointError(
+                "Cannot create a client for this Inference Endpoint as it is "
+                "not yet deployed."
+            )
+        self._inference_client = InferenceClient(
+            model=endpoint_url,
+            token=self.get_token(),
+            headers={"X-use-cache": str(self.config.use_cache).lower()},
+        )
+        return self._inference_client
 
     def provision(self) -> None:
         """Provision or update remote Hugging Face deployment instance.
@@ -146,25 +221,9 @@ class HuggingFaceDeploymentService(BaseDeploymentService):
         """
         try:
             # Attempt to create and wait for the inference endpoint
-            hf_endpoint = create_inference_endpoint(
-                name=self._generate_an_endpoint_name(),
-                repository=self.config.repository,
-                framework=self.config.framework,
-                accelerator=self.config.accelerator,
-                instance_size=self.config.instance_size,
-                instance_type=self.config.instance_type,
-                region=self.config.region,
-                vendor=self.config.vendor,
-                account_id=self.config.account_id,
-                min_replica=self.config.min_replica,
-                max_replica=self.config.max_replica,
-                revision=self.config.revision,
-                task=self.config.task,
-                custom_image=self.config.custom_image,
-                type=self.config.endpoint_type,
-                token=self.get_token(),
-                namespace=self.config.namespace,
-            ).wait(timeout=POLLING_TIMEOUT)
+            hf_endpoint = self._create_inference_endpoint().wait(
+                timeout=POLLING_TIMEOUT
+            )
 
         except Exception as e:
             self.status.update_state(
@@ -224,13 +283,26 @@ class HuggingFaceDeploymentService(BaseDeploymentService):
         Args:
             force: if True, the remote deployment instance will be
                 forcefully deprovisioned.
+
+        Raises:
+            HfHubHTTPError: if the inference endpoint could not be deleted
+                and `force` is False.
         """
+        self._inference_client = None
         try:
-            self.hf_endpoint.delete()
-        except HfHubHTTPError:
+            self._call_with_retries(lambda: self.hf_endpoint.delete())
+        except HfHubHTTPError as e:
+            if _get_status_code(e) == 404:
+                logger.error(
+                    "Hugging Face Inference Endpoint is deleted or cannot be "
+                    "found."
+                )
+                return
             logger.error(
-                "Hugging Face Inference Endpoint is deleted or cannot be found."
+                "Failed to delete Hugging Face Inference Endpoint: %s", e
             )
+            if not force:
+                raise
 
     def predict(self, data: "Any", max_new_tokens: int) -> "Any":
         """Make a prediction using the service.
@@ -246,22 +318,28 @@ class HuggingFaceDeploymentService(BaseDeploymentService):
             Exception: if the service is not running
             NotImplementedError: if task is not supported.
         """
-        if not self.is_running:
+        # Fetch the endpoint only once instead of once for every status, URL
+        # and task lookup
+        try:
+            hf_endpoint: Optional[InferenceEndpoint] = self.hf_endpoint
+        except (InferenceEndpointError, HfHubHTTPError):
+            hf_endpoint = None
+        if (
+            hf_endpoint is None
+            or hf_endpoint.status != InferenceEndpointStatus.RUNNING
+        ):
             raise Exception(
                 "Hugging Face endpoint inference service is not running. "
                 "Please start the service before making predictions."
             )
-        if self.prediction_url is not None:
-            if self.hf_endpoint.task == "text-generation":
-                result = self.inference_client.task_generation(
-                    data, max_new_tokens=max_new_tokens
-                )
-        else:
+        if hf_endpoint.task != "text-generation":
             # TODO: Add support for all different supported tasks
             raise NotImplementedError(
                 "Tasks other than text-generation is not implemented."
             )
-        return result
+        return self._get_inference_client(hf_endpoint).text_generation(
+            data, max_new_tokens=max_new_tokens
+        )
 
     def get_logs(
         self, follow: bool = False, tail: Optional[int] = None
@@ -281,12 +359,111 @@ class HuggingFaceDeploymentService(BaseDeploymentService):
         )
         return  # type: ignore
 
+    def _create_inference_endpoint(self) -> InferenceEndpoint:
+        """Create the Hugging Face inference endpoint.
+
+        Transient errors are retried. A create request that failed with such
+        an error may still have created the endpoint on the server, in which
+        case the retried request fails with a conflict and the existing
+        endpoint is returned instead.
+
+        Returns:
+            The created inference endpoint.
+        """
+        is_retry = False
+
+        def _create() -> InferenceEndpoint:
+            nonlocal is_retry
+            try:
+                return create_inference_endpoint(
+                    name=self._generate_an_endpoint_name(),
+                    repository=self.config.repository,
+                    framework=self.config.framework,
+                    accelerator=self.config.accelerator,
+                    instance_size=self.config.instance_size,
+                    instance_type=self.config.instance_type,
+                    region=self.config.region,
+                    vendor=self.config.vendor,
+                    account_id=self.config.account_id,
+                    min_replica=self.config.min_replica,
+                    max_replica=self.config.max_replica,
+                    revision=self.config.revision,
+                    task=self.config.task,
+                    custom_image=self.config.custom_image,
+                    type=self.config.endpoint_type,
+                    token=self.get_token(),
+                    namespace=self.config.namespace,
+                )
+            except HfHubHTTPError as e:
+                if is_retry and _get_status_code(e) == 409:
+                    logger.info(
+                        "Hugging Face inference endpoint %s was already "
+                        "created by a previous attempt.",
+                        self._generate_an_endpoint_name(),
+                    )
+                    return get_inference_endpoint(
+                        name=self._generate_an_endpoint_name(),
+                        token=self.get_token(),
+                        namespace=self.config.namespace,
+                    )
+                is_retry = True
+                raise
+
+        return self._call_with_retries(_create)
+
+    def _call_with_retries(self, func: Callable[[], T]) -> T:
+        """Call a Hugging Face API function and retry on transient errors.
+
+        Requests failing because of rate limiting or server-side errors are
+        retried with exponential backoff, all other errors are raised
+        immediately.
+
+        Args:
+            func: The function to call.
+
+        Returns:
+            The return value of the function.
+
+        Raises:
+            HfHubHTTPError: If the request failed with a non-transient error
+                or the maximum number of attempts was reached.
+        """
+        backoff_interval = 1
+        attempt = 1
+        while True:
+            try:
+                return func()
+            except HfHubHTTPError as e:
+                status_code = _get_status_code(e)
+                is_transient = (
+                    status_code is None
+                    or status_code == 429
+                    or status_code >= 500
+                )
+                if not is_transient or attempt >= self.config.retry_attempts:
+                    raise
+                logger.warning(
+                    "Hugging Face API request failed: %s. Retrying in %d "
+                    "seconds (attempt %d/%d)...",
+                    e,
+                    backoff_interval,
+                    attempt,
+                    self.config.retry_attempts,
+                )
+                time.sleep(backoff_interval)
+                backoff_interval = min(
+                    backoff_interval * 2, self.config.retry_max_backoff
+                )
+                attempt += 1
+
     def _generate_an_endpoint_name(self) -> str:
         """Generate a unique name for the Hugging Face Inference Endpoint.
 
         Returns:
             A unique name for the Hugging Face Inference Endpoint.
         """
+        # The first 8 characters of the hex and the hyphenated string
+        # representation are identical, but `hex` skips the hyphen formatting
         return (
-            f"{self.config.service_name}-{str(self.uuid)[:UUID_SLICE_LENGTH]}"
+            f"{self.config.service_name}-{self.uuid.hex[:UUID_SLICE_LENGTH]}"
         )
@@ -45,6 +45,12 @@ class TensorflowDatasetMaterializer(BaseMaterializer):
         Returns:
             A tf.data.Dataset object.
         """
+        if io_utils.is_local_filesystem(self.uri):
+            # The dataset can be read in place from a local artifact store
+            return tf.data.experimental.load(
+                os.path.join(self.uri, DEFAULT_FILENAME)
+            )
+
         temp_dir = tempfile.mkdtemp()
         io_utils.copy_dir(self.uri, temp_dir)
         path = os.path.join(temp_dir, DEFAULT_FILENAME)
@@ -59,6 +65,16 @@ class TensorflowDatasetMaterializer(BaseMaterializer):
         Args:
             dataset: The dataset to persist.
         """
+        if io_utils.is_local_filesystem(self.uri):
+            # Write straight into a local artifact store
+            tf.data.experimental.save(
+                dataset,
+                os.path.join(self.uri, DEFAULT_FILENAME),
+                compression=None,
+                shard_func=None,
+            )
+            return
+
         temp_dir = tempfile.TemporaryDirectory()
         path = os.path.join(temp_dir.name, DEFAULT_FILENAME)
         try:
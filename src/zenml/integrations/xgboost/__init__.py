@@ -21,7 +21,7 @@ class XgboostIntegration(Integration):
     """Definition of xgboost integration for ZenML."""
 
     NAME = XGBOOST
-    REQUIREMENTS = ["xgboost>=1.0.0"]
+    REQUIREMENTS = ["xgboost>=1.6.0"]
 
     @classmethod
     def activate(cls) -> None:
@@ -14,7 +14,6 @@
 """Implementation of an XGBoost booster materializer."""
 
 import os
-import tempfile
 from typing import Any, ClassVar, Tuple, Type
 
 import xgboost as xgb
@@ -22,8 +21,11 @@ import xgboost as xgb
 from zenml.enums import ArtifactType
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.utils import io_utils
 
-DEFAULT_FILENAME = "model.json"
+DEFAULT_FILENAME = "model.ubj"
+# Boosters used to be stored as JSON, keep reading those artifacts
+LEGACY_JSON_FILENAME = "model.json"
 
 
 class XgboostBoosterMaterializer(BaseMaterializer):
@@ -33,7 +35,7 @@ class XgboostBoosterMaterializer(BaseMaterializer):
     ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.MODEL
 
     def load(self, data_type: Type[Any]) -> xgb.Booster:
-        """Reads a xgboost Booster model from a serialized JSON file.
+        """Reads a xgboost Booster model from a serialized UBJSON or JSON file.
 
         Args:
             data_type: A xgboost Booster type.
@@ -42,36 +44,29 @@ class XgboostBoosterMaterializer(BaseMaterializer):
             A xgboost Booster object.
         """
         filepath = os.path.join(self.uri, DEFAULT_FILENAME)
+        if not fileio.exists(filepath):
+            filepath = os.path.join(self.uri, LEGACY_JSON_FILENAME)
 
-        # Create a temporary folder
-        temp_dir = tempfile.mkdtemp(prefix="zenml-temp-")
-        temp_file = os.path.join(str(temp_dir), DEFAULT_FILENAME)
-
-        # Copy from artifact store to temporary file
-        fileio.copy(filepath, temp_file)
         booster = xgb.Booster()
-        booster.load_model(temp_file)
-
-        # Cleanup and return
-        fileio.rmtree(temp_dir)
+        if io_utils.is_local_filesystem(filepath):
+            # XGBoost can read files from a local artifact store itself
+            booster.load_model(filepath)
+            return booster
+
+        # Load the model straight from the artifact store bytes without
+        # going through a local temporary file
+        with fileio.open(filepath, "rb") as f:
+            buffer = bytearray(f.read())
+        booster.load_model(buffer)
         return booster
 
     def save(self, booster: xgb.Booster) -> None:
-        """Creates a JSON serialization for a xgboost Booster model.
+        """Creates a UBJSON serialization for a xgboost Booster model.
 
         Args:
             booster: A xgboost Booster model.
         """
         filepath = os.path.join(self.uri, DEFAULT_FILENAME)
 
-        # Make a temporary phantom artifact
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as f:
-            booster.save_model(f.name)
-            # Copy it into artifact store
-            fileio.copy(f.name, filepath)
-
-        # Close and remove the temporary file
-        f.close()
-        fileio.remove(f.name)
+        with fileio.open(filepath, "wb") as f:
+            f.write(booster.save_raw(raw_format="ubj"))
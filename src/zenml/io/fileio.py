@@ -14,6 +14,7 @@
 """Functionality for reading, writing and managing files."""
 
 import os
+import shutil
 from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
 
 # this import required for CI to get local filesystem
@@ -24,6 +25,10 @@ from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Block size used when streaming a file between two different filesystems.
+# Large enough to amortize per-request overhead on remote object stores.
+COPY_BLOCK_SIZE = 4 * 1024 * 1024
+
 
 def _get_filesystem(path: "PathType") -> Type["BaseFilesystem"]:
     """Returns a filesystem class for a given path from the registry.
@@ -87,11 +92,10 @@ def copy(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
                 f"Destination file '{convert_to_str(dst)}' already exists "
                 f"and `overwrite` is false."
             )
-        with open(src, mode="rb") as f:
-            contents = f.read()
-
-        with open(dst, mode="wb") as f:
-            f.write(contents)
+        with open(src, mode="rb") as src_file, open(
+            dst, mode="wb"
+        ) as dst_file:
+            shutil.copyfileobj(src_file, dst_file, COPY_BLOCK_SIZE)
 
 
 def exists(path: "PathType") -> bool:
@@ -15,8 +15,9 @@
 
 import fnmatch
 import os
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, Iterator, Tuple
 
 import click
 
@@ -33,10 +34,15 @@ from zenml.io.fileio import (
     rename,
     walk,
 )
+from zenml.io.filesystem_registry import default_filesystem_registry
+from zenml.io.local_filesystem import LocalFilesystem
 
 if TYPE_CHECKING:
     from zenml.io.filesystem import PathType
 
+# Maximum number of files that are copied concurrently by `copy_dir`.
+COPY_DIR_MAX_WORKERS = 32
+
 
 def is_root(path: str) -> bool:
     """Returns true if path has no parent in local filesystem.
@@ -96,15 +102,17 @@ def read_file_contents_as_string(file_path: str) -> str:
         return f.read()  # type: ignore[no-any-return]
 
 
-def copy_dir(
-    source_dir: str, destination_dir: str, overwrite: bool = False
-) -> None:
-    """Copies dir from source to destination.
+def _iterate_files_to_copy(
+    source_dir: str, destination_dir: str
+) -> Iterator[Tuple[str, str]]:
+    """Recursively lists the files to copy from a source directory.
 
     Args:
         source_dir: Path to copy from.
         destination_dir: Path to copy to.
-        overwrite: Boolean. If false, function throws an error before overwrite.
+
+    Yields:
+        Tuples of source and destination path for each file to copy.
     """
     for source_file in listdir(source_dir):
         source_path = os.path.join(source_dir, convert_to_str(source_file))
@@ -116,12 +124,57 @@ def copy_dir(
                 # if the destination is a subdirectory of the source, we skip
                 # copying it to avoid an infinite loop.
                 continue
-            copy_dir(source_path, destination_path, overwrite)
+            yield from _iterate_files_to_copy(source_path, destination_path)
         else:
-            create_dir_recursive_if_not_exists(
-                os.path.dirname(destination_path)
-            )
-            copy(str(source_path), str(destination_path), overwrite)
+            yield str(source_path), str(destination_path)
+
+
+def copy_dir(
+    source_dir: str, destination_dir: str, overwrite: bool = False
+) -> None:
+    """Copies dir from source to destination.
+
+    The individual files are copied concurrently as copying is I/O bound,
+    which mostly pays off when copying many files from or to a remote
+    artifact store.
+
+    Args:
+        source_dir: Path to copy from.
+        destination_dir: Path to copy to.
+        overwrite: Boolean. If false, function throws an error before overwrite.
+    """
+    # Listing the source and creating the destination directories happens on
+    # the calling thread, which initializes both filesystems (and fetches
+    # their credentials) once before any copies run concurrently.
+    files_to_copy = list(_iterate_files_to_copy(source_dir, destination_dir))
+    for destination_parent_dir in {
+        os.path.dirname(destination_path)
+        for _, destination_path in files_to_copy
+    }:
+        create_dir_recursive_if_not_exists(destination_parent_dir)
+
+    if len(files_to_copy) <= 1:
+        for source_path, destination_path in files_to_copy:
+            copy(source_path, destination_path, overwrite)
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(COPY_DIR_MAX_WORKERS, len(files_to_copy))
+    )
+    try:
+        futures = [
+            executor.submit(copy, source_path, destination_path, overwrite)
+            for source_path, destination_path in files_to_copy
+        ]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        # Don't start any more copies once one of them failed
+        for future in not_done:
+            future.cancel()
+        for future in done:
+            # Re-raises any exception that occurred while copying the file
+            future.result()
+    finally:
+        executor.shutdown(wait=True)
 
 
 def find_files(dir_path: "PathType", pattern: str) -> Iterable[str]:
@@ -155,6 +208,21 @@ def is_remote(path: str) -> bool:
     return any(path.startswith(prefix) for prefix in REMOTE_FS_PREFIX)
 
 
+def is_local_filesystem(path: "PathType") -> bool:
+    """Returns True if path is handled by a local filesystem.
+
+    Args:
+        path: Any path.
+
+    Returns:
+        True if the filesystem registered for the path is local, else False.
+    """
+    return issubclass(
+        default_filesystem_registry.get_filesystem_for_path(path),
+        LocalFilesystem,
+    )
+
+
 def create_file_if_not_exists(
     file_path: str, file_contents: str = "{}"
 ) -> None:
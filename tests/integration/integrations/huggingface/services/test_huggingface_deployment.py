@@ -0,0 +1,185 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from typing import Optional
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from huggingface_hub.utils import HfHubHTTPError
+from pydantic import ValidationError
+from requests import Response
+
+from zenml.integrations.huggingface.services.huggingface_deployment import (
+    HuggingFaceDeploymentService,
+    HuggingFaceServiceConfig,
+)
+
+MODULE = "zenml.integrations.huggingface.services.huggingface_deployment"
+
+
+def _http_error(status_code: Optional[int]) -> HfHubHTTPError:
+    """Creates a Hugging Face HTTP error with the given status code."""
+    if status_code is None:
+        return HfHubHTTPError("Connection aborted.")
+
+    response = Response()
+    response.status_code = status_code
+    return HfHubHTTPError(f"{status_code} Error", response=response)
+
+
+@pytest.fixture
+def service() -> HuggingFaceDeploymentService:
+    """Fixture for a Hugging Face deployment service."""
+    return HuggingFaceDeploymentService(
+        uuid=uuid4(),
+        config=HuggingFaceServiceConfig(
+            model_name="test-model",
+            namespace="test-namespace",
+            retry_attempts=5,
+            retry_max_backoff=4,
+        ),
+    )
+
+
+@pytest.fixture
+def mock_sleep(mocker):
+    """Fixture that prevents the retries from actually sleeping."""
+    return mocker.patch(f"{MODULE}.time.sleep")
+
+
+@pytest.mark.parametrize("status_code", [429, 503, None])
+def test_call_with_retries_retries_transient_errors(
+    service, mock_sleep, status_code
+):
+    """Tests that rate limits, server and connection errors are retried."""
+    func = MagicMock(
+        side_effect=[_http_error(status_code), _http_error(status_code), "ok"]
+    )
+
+    assert service._call_with_retries(func) == "ok"
+    assert func.call_count == 3
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2]
+
+
+def test_call_with_retries_caps_backoff_and_attempts(service, mock_sleep):
+    """Tests that the backoff is capped and the last error is re-raised."""
+    func = MagicMock(side_effect=_http_error(503))
+
+    with pytest.raises(HfHubHTTPError):
+        service._call_with_retries(func)
+
+    assert func.call_count == 5
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [
+        1,
+        2,
+        4,
+        4,
+    ]
+
+
+def test_call_with_retries_raises_non_transient_errors(service, mock_sleep):
+    """Tests that non-transient errors are raised without retrying."""
+    func = MagicMock(side_effect=_http_error(404))
+
+    with pytest.raises(HfHubHTTPError):
+        service._call_with_retries(func)
+
+    assert func.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_create_inference_endpoint_recovers_from_conflict_on_retry(
+    mocker, service, mock_sleep
+):
+    """Tests that an endpoint created by a failed attempt is reused."""
+    mocker.patch.object(
+        HuggingFaceDeploymentService, "get_token", return_value="token"
+    )
+    mock_create = mocker.patch(
+        f"{MODULE}.create_inference_endpoint",
+        side_effect=[_http_error(504), _http_error(409)],
+    )
+    existing_endpoint = MagicMock()
+    mock_get = mocker.patch(
+        f"{MODULE}.get_inference_endpoint", return_value=existing_endpoint
+    )
+
+    assert service._create_inference_endpoint() is existing_endpoint
+    assert mock_create.call_count == 2
+    mock_get.assert_called_once_with(
+        name=service._generate_an_endpoint_name(),
+        token="token",
+        namespace="test-namespace",
+    )
+
+
+def test_create_inference_endpoint_raises_conflict_on_first_attempt(
+    mocker, service, mock_sleep
+):
+    """Tests that a conflict without a previous attempt is raised."""
+    mocker.patch.object(
+        HuggingFaceDeploymentService, "get_token", return_value="token"
+    )
+    mocker.patch(
+        f"{MODULE}.create_inference_endpoint", side_effect=_http_error(409)
+    )
+    mock_get = mocker.patch(f"{MODULE}.get_inference_endpoint")
+
+    with pytest.raises(HfHubHTTPError):
+        service._create_inference_endpoint()
+
+    mock_get.assert_not_called()
+
+
+def test_deprovision_ignores_missing_endpoint(mocker, service, mock_sleep):
+    """Tests that deleting an endpoint that no longer exists succeeds."""
+    mock_endpoint = MagicMock()
+    mock_endpoint.delete.side_effect = _http_error(404)
+    mocker.patch.object(
+        HuggingFaceDeploymentService,
+        "hf_endpoint",
+        new_callable=mocker.PropertyMock,
+        return_value=mock_endpoint,
+    )
+
+    service.deprovision()
+
+    mock_endpoint.delete.assert_called_once()
+
+
+def test_deprovision_raises_failed_delete(mocker, service, mock_sleep):
+    """Tests that failed deletes are only ignored when forced."""
+    mock_endpoint = MagicMock()
+    mock_endpoint.delete.side_effect = _http_error(403)
+    mocker.patch.object(
+        HuggingFaceDeploymentService,
+        "hf_endpoint",
+        new_callable=mocker.PropertyMock,
+        return_value=mock_endpoint,
+    )
+
+    with pytest.raises(HfHubHTTPError):
+        service.deprovision()
+
+    service.deprovision(force=True)
+
+
+@pytest.mark.parametrize(
+    "config", [{"retry_attempts": 0}, {"retry_max_backoff": 0}]
+)
+def test_service_config_rejects_invalid_retry_settings(config):
+    """Tests that retry settings must be positive."""
+    with pytest.raises(ValidationError):
+        HuggingFaceServiceConfig(model_name="test-model", **config)
@@ -12,12 +12,15 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
+
 import tensorflow as tf
 
 from tests.unit.test_general import _test_materializer
 from zenml.integrations.tensorflow.materializers.tf_dataset_materializer import (
     TensorflowDatasetMaterializer,
 )
+from zenml.utils import io_utils
 
 
 def test_tensorflow_tf_dataset_materializer(clean_client):
@@ -30,3 +33,22 @@ def test_tensorflow_tf_dataset_materializer(clean_client):
     )
 
     assert isinstance(dataset.element_spec.dtype, type(tf.int32))
+
+
+def test_tensorflow_tf_dataset_materializer_remote_artifact_store(
+    tmp_path, mocker
+):
+    """Tests that remote artifact stores go through a temporary directory."""
+    mocker.patch.object(io_utils, "is_local_filesystem", return_value=False)
+    copy_dir = mocker.spy(io_utils, "copy_dir")
+    uri = str(tmp_path / "artifact")
+    os.makedirs(uri)
+    materializer = TensorflowDatasetMaterializer(uri=uri)
+
+    materializer.save(tf.data.Dataset.from_tensor_slices([1, 2, 3]))
+    dataset = materializer.load(tf.data.Dataset)
+
+    assert copy_dir.call_count == 2
+    assert copy_dir.call_args_list[0].args[1] == uri
+    assert copy_dir.call_args_list[1].args[0] == uri
+    assert list(dataset.as_numpy_iterator()) == [1, 2, 3]
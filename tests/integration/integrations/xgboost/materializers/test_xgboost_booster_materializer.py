@@ -0,0 +1,69 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+
+import numpy as np
+import xgboost as xgb
+
+from tests.unit.test_general import _test_materializer
+from zenml.integrations.xgboost.materializers.xgboost_booster_materializer import (
+    XgboostBoosterMaterializer,
+)
+from zenml.utils import io_utils
+
+
+def _train_booster() -> xgb.Booster:
+    """Trains a small XGBoost booster."""
+    dtrain = xgb.DMatrix(np.random.randn(10, 3), label=np.random.randn(10))
+    return xgb.train({}, dtrain, num_boost_round=2)
+
+
+def test_xgboost_booster_materializer(clean_client):
+    """Tests whether the steps work for the XGBoost Booster materializer."""
+    booster = _train_booster()
+
+    loaded_booster = _test_materializer(
+        step_output=booster,
+        materializer_class=XgboostBoosterMaterializer,
+        expected_metadata_size=1,
+    )
+
+    assert loaded_booster.num_features() == 3
+    assert loaded_booster.num_boosted_rounds() == 2
+
+
+def test_xgboost_booster_materializer_loads_legacy_json(tmp_path):
+    """Tests that boosters stored in the previous JSON format still load."""
+    _train_booster().save_model(os.path.join(tmp_path, "model.json"))
+
+    materializer = XgboostBoosterMaterializer(uri=str(tmp_path))
+    loaded_booster = materializer.load(xgb.Booster)
+
+    assert loaded_booster.num_features() == 3
+    assert loaded_booster.num_boosted_rounds() == 2
+
+
+def test_xgboost_booster_materializer_loads_from_remote_bytes(
+    tmp_path, mocker
+):
+    """Tests that boosters in remote artifact stores are loaded from bytes."""
+    mocker.patch.object(io_utils, "is_local_filesystem", return_value=False)
+    materializer = XgboostBoosterMaterializer(uri=str(tmp_path))
+    materializer.save(_train_booster())
+
+    loaded_booster = materializer.load(xgb.Booster)
+
+    assert loaded_booster.num_features() == 3
+    assert loaded_booster.num_boosted_rounds() == 2
@@ -24,6 +24,7 @@ from hypothesis import HealthCheck, given, settings
 from hypothesis.strategies import text
 
 from zenml.io import fileio
+from zenml.io.local_filesystem import LocalFilesystem
 from zenml.logger import get_logger
 from zenml.utils import io_utils
 
@@ -101,6 +102,41 @@ def test_copy_moves_file_to_new_location(tmp_path) -> None:
     assert os.path.exists(dst)
 
 
+def test_copy_streams_file_between_different_filesystems(
+    tmp_path, mocker
+) -> None:
+    """Test that copy streams files between two different filesystems."""
+    src = os.path.join(tmp_path, "src", "test_file.bin")
+    dst = os.path.join(tmp_path, "dst", "test_file.bin")
+    os.makedirs(os.path.dirname(src))
+    os.makedirs(os.path.dirname(dst))
+    content = os.urandom(2 * fileio.COPY_BLOCK_SIZE + 1)
+    with open(src, "wb") as f:
+        f.write(content)
+
+    class OtherFilesystem(LocalFilesystem):
+        """Local filesystem registered as a different filesystem class."""
+
+    mocker.patch.object(
+        fileio,
+        "_get_filesystem",
+        side_effect=lambda path: (
+            OtherFilesystem
+            if str(path).startswith(os.path.dirname(dst))
+            else LocalFilesystem
+        ),
+    )
+    copyfile = mocker.spy(LocalFilesystem, "copyfile")
+    dst_open = mocker.spy(OtherFilesystem, "open")
+
+    fileio.copy(src, dst)
+
+    copyfile.assert_not_called()
+    dst_open.assert_called_once_with(dst, mode="wb")
+    with open(dst, "rb") as f:
+        assert f.read() == content
+
+
 def test_copy_raises_error_when_file_exists(tmp_path) -> None:
     """Test that copy raises an error when the file already exists in the desired location."""
     src = os.path.join(tmp_path, "test_file.txt")
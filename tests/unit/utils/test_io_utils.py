@@ -15,6 +15,8 @@
 import os
 import platform
 import string
+import threading
+import time
 from pathlib import Path
 from types import GeneratorType
 
@@ -23,6 +25,7 @@ from hypothesis import given
 from hypothesis.strategies import text
 
 from zenml.constants import ENV_ZENML_CONFIG_PATH, REMOTE_FS_PREFIX
+from zenml.io.filesystem import BaseFilesystem
 from zenml.utils import io_utils
 
 TEMPORARY_FILE_NAME = "a_file.txt"
@@ -158,6 +161,50 @@ def test_copy_dir_throws_error_if_overwriting(tmp_path):
     )
 
 
+def test_copy_dir_copies_nested_files(tmp_path):
+    """Tests copying a directory with many files in nested subdirectories."""
+    dir_path = os.path.join(tmp_path, "test")
+    for i in range(50):
+        file_path = os.path.join(dir_path, f"shard_{i % 5}", f"{i}.txt")
+        io_utils.create_dir_recursive_if_not_exists(os.path.dirname(file_path))
+        io_utils.create_file_if_not_exists(file_path, str(i))
+
+    new_dir_path = os.path.join(tmp_path, "test2")
+    io_utils.copy_dir(dir_path, new_dir_path)
+
+    for i in range(50):
+        file_path = os.path.join(new_dir_path, f"shard_{i % 5}", f"{i}.txt")
+        assert io_utils.read_file_contents_as_string(file_path) == str(i)
+
+
+def test_copy_dir_stops_copying_after_first_failure(tmp_path, mocker):
+    """Tests that copy_dir doesn't start new copies once a copy failed."""
+    dir_path = os.path.join(tmp_path, "test")
+    for i in range(20):
+        io_utils.create_file_if_not_exists(
+            os.path.join(dir_path, f"{i}.txt"), str(i)
+        )
+
+    lock = threading.Lock()
+    copied = []
+
+    def _copy(src: str, dst: str, overwrite: bool = False) -> None:
+        with lock:
+            is_first_copy = not copied
+            copied.append(src)
+        if is_first_copy:
+            raise FileExistsError(dst)
+        time.sleep(0.05)
+
+    mocker.patch.object(io_utils, "copy", side_effect=_copy)
+    mocker.patch.object(io_utils, "COPY_DIR_MAX_WORKERS", 2)
+
+    with pytest.raises(FileExistsError):
+        io_utils.copy_dir(dir_path, os.path.join(tmp_path, "test2"))
+
+    assert len(copied) < 20
+
+
 def test_is_root_when_true():
     """Check is_root returns true if path is the root"""
     assert io_utils.is_root("/")
@@ -216,6 +263,18 @@ def test_is_remote_when_using_non_remote_prefix(filesystem):
     assert io_utils.is_remote(some_random_path) is False
 
 
+def test_is_local_filesystem(tmp_path, mocker):
+    """is_local_filesystem checks the filesystem registered for the path."""
+    assert io_utils.is_local_filesystem(str(tmp_path))
+
+    mocker.patch.object(
+        io_utils.default_filesystem_registry,
+        "get_filesystem_for_path",
+        return_value=BaseFilesystem,
+    )
+    assert io_utils.is_local_filesystem("s3://some_bucket/some_dir") is False
+
+
 def test_create_file_if_not_exists(tmp_path) -> None:
     """Test that create_file_if_not_exists creates a file"""
     io_utils.create_file_if_not_exists(os.path.join(tmp_path, "new_file.txt"))